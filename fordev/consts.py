@@ -29,12 +29,28 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_13_6) AppleWebKit/605.1.15 (KHTML, like Gecko)',
 ]
 
-ALL_UF_CODE = [
+ALL_UF_CODE = (
     'AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'ES', 'GO', 'MA',
     'MT', 'MS', 'MG','PA', 'PB', 'PR', 'PE', 'PI', 'RJ',
     'RN', 'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO', 'DF'
-]
+)
+
+# The 9th digit of the CPF indicates the fiscal region of the UF that issued it.
+CPF_FISCAL_REGIONS = {
+    'DF': 1, 'GO': 1, 'MS': 1, 'MT': 1, 'TO': 1,
+    'AC': 2, 'AM': 2, 'AP': 2, 'PA': 2, 'RO': 2, 'RR': 2,
+    'CE': 3, 'MA': 3, 'PI': 3,
+    'AL': 4, 'PB': 4, 'PE': 4, 'RN': 4,
+    'BA': 5, 'SE': 5,
+    'MG': 6,
+    'ES': 7, 'RJ': 7,
+    'SP': 8,
+    'PR': 9, 'SC': 9,
+    'RS': 0
+}
 
+# Deprecated: use ALL_VEHICLE_BRAND_NAMES and ALL_VEHICLE_BRAND_CODES instead.
+# Kept for backward compatibility.
 ALL_VEHICLE_BRANDS = {
     1: {'brand_name': 'Acura', 'code': 1},
     2: {'brand_name': 'Agrale', 'code': 2},
@@ -125,6 +141,16 @@ ALL_VEHICLE_BRANDS = {
     87: {'brand_name': 'Walk', 'code': 120}
 }
 
+# Name and 4devs code of the vehicle brands, aligned by index.
+# The brand number n (1 to 87) used in fordev is at index n - 1.
+ALL_VEHICLE_BRAND_NAMES = tuple(
+    ALL_VEHICLE_BRANDS[n]['brand_name'] for n in sorted(ALL_VEHICLE_BRANDS)
+)
+
+ALL_VEHICLE_BRAND_CODES = tuple(
+    ALL_VEHICLE_BRANDS[n]['code'] for n in sorted(ALL_VEHICLE_BRANDS)
+)
+
 ALL_BANK_FLAGS = {
     1: 'master',
     2: 'visa16',
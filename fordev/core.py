@@ -6,7 +6,7 @@ fordev.core
 Este módulo é o core para criar e manipular requests para a API do site 4devs.
 """
 
-__all__ = ['fordev_request']
+__all__ = ['fordev_request', 'afordev_request', 'async_session']
 
 from fordev.__about__ import __version__
 from fordev.__about__ import __author__
@@ -14,14 +14,62 @@ from fordev.__about__ import __email__
 from fordev.__about__ import __author_github__
 from fordev.__about__ import __project_github__
 
+import asyncio
+import threading
+
+from contextlib import asynccontextmanager
 from random import choice
+from typing import Union
 
 import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cachetools import TTLCache
+
 from fordev.consts import URL_4DEV_API
 from fordev.consts import USER_AGENTS
 
 
+# Headers sent in all requests to 4devs. The user-agent, content-length
+# and referer are filled on each request by _create_headers.
+_BASE_HEADERS = {
+    "user-agent": None,
+    "authority": "www.4devs.com.br",
+    "method": "POST",
+    "path": "/ferramentas_online.php",
+    "scheme": "https",
+    "accept": "*/*",
+    "accept-encoding": "gzip, deflate, br",
+    "accept-language": "pt,en-US;q=0.9,en;q=0.8",
+    "content-length": None,
+    "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "dnt": "1",
+    "origin": "https://www.4devs.com.br",
+    "referer": None,
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "x-requested-with": "XMLHttpRequest"
+}
+
+# Sessions of the sync requests, one per thread, since requests doesn't guarantee
+# that a Session is thread-safe (see _get_session).
+_THREAD_LOCAL = threading.local()
+
+# Limit of async requests in flight at the same time, avoiding the 4devs rate limit.
+MAX_CONCURRENT_REQUESTS = 8
+
+# State of the open async_session blocks of each running event loop: the shared
+# session, the semaphore of the requests in flight and the number of open blocks.
+_ASYNC_STATES = {}
+
+# Successful responses of requests flagged as cacheable, shared by the sync and async requests.
+_RESPONSE_CACHE = TTLCache(maxsize=64, ttl=3600)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
 def _random_user_agent() -> str:
     """Obtenha um user agent aleatório."""
 
@@ -42,32 +90,77 @@ def _create_headers(content_length: int, referer: str) -> dict:
 
     """
 
-    headers = {
-        "user-agent": _random_user_agent(),
-        "authority": "www.4devs.com.br",
-        "method": "POST",
-        "path": "/ferramentas_online.php",
-        "scheme": "https",
-        "accept": "*/*",
-        "accept-encoding": "gzip, deflate, br",
-        "accept-language": "pt,en-US;q=0.9,en;q=0.8",
-        "content-length": str(content_length),
-        "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "dnt": "1",
-        "origin": "https://www.4devs.com.br",
-        "referer": "https://www.4devs.com.br/{}".format(referer),
-        "sec-fetch-dest": "empty",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-        "x-requested-with": "XMLHttpRequest"
-    }
+    headers = _BASE_HEADERS.copy()
+
+    headers["user-agent"] = _random_user_agent()
+    headers["content-length"] = str(content_length)
+    headers["referer"] = "https://www.4devs.com.br/{}".format(referer)
 
     return headers
 
 
-def fordev_request(content_length: int, referer: str, payload: dict) -> dict:
+def _get_session() -> requests.Session:
+    """Obtenha a sessão HTTP das requests síncronas da thread atual.
+
+    A sessão é criada na primeira request da thread e reutilizada nas seguintes,
+    reaproveitando as conexões (keep-alive) com o site 4devs em vez de abrir uma
+    nova conexão TCP/TLS a cada chamada.
+    """
+
+    session = getattr(_THREAD_LOCAL, 'session', None)
+
+    if session is None:
+        session = _THREAD_LOCAL.session = requests.Session()
+        session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            )
+        )
+
+    return session
+
+
+def _cache_key(referer: str, payload: Union[dict, bytes]) -> tuple:
+    """Gere a chave do cache de respostas da request."""
+
+    if isinstance(payload, bytes):
+        return (referer, payload)
+
+    return (referer, frozenset(payload.items()))
+
+
+def _get_cached_response(referer: str, payload: Union[dict, bytes]):
+    """Obtenha uma cópia da resposta em cache da request, se existir."""
+
+    with _RESPONSE_CACHE_LOCK:
+        r = _RESPONSE_CACHE.get(_cache_key(referer, payload))
+
+    return r.copy() if r is not None else None
+
+
+def _cache_response(referer: str, payload: Union[dict, bytes], r: dict) -> None:
+    """Armazene em cache uma cópia da resposta da request, se for de sucesso."""
+
+    if r['msg'] == 'success':
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[_cache_key(referer, payload)] = r.copy()
+
+
+def fordev_request(
+        content_length: int,
+        referer: str,
+        payload: Union[dict, bytes],
+        cacheable: bool=False,
+        as_bytes: bool=False
+    ) -> dict:
     """Cria uma request HTTP a API do site 4devs e 
     retorna seu conteúdo em formato de dicionário.
+
+    As requests de uma mesma thread compartilham a mesma sessão HTTP, reaproveitando
+    as conexões já abertas com o site 4devs entre as chamadas dos geradores e validadores.
     
     Parameters
     ----------
@@ -79,11 +172,28 @@ def fordev_request(content_length: int, referer: str, payload: dict) -> dict:
         Pode-se interpretar como o endpoint do serviço a ser disponibilizado.
 
     payload
-        Um dicionário de dados contendo a ação e outros dados solicitados pela API.
+        Um dicionário de dados contendo a ação e outros dados solicitados pela API,
+        ou esses mesmos dados já codificados em ``bytes`` no formato
+        ``application/x-www-form-urlencoded``, que são enviados sem nova codificação.
+
+    cacheable
+        Se receber o valor ``True``, a resposta de sucesso é armazenada em cache por 1 hora
+        e reutilizada nas próximas requests com o mesmo ``referer`` e ``payload``.
+        Use somente para requests cujo retorno não é aleatório.
+
+    as_bytes
+        Se receber o valor ``True``, retorna o conteúdo da resposta em ``bytes``, sem decodificá-lo.
+        Útil para respostas em JSON, que podem ser convertidas diretamente dos ``bytes``.
     """
 
+    if cacheable:
+        r = _get_cached_response(referer, payload)
+
+        if r is not None:
+            return r
+
     try:
-        response = requests.post(
+        response = _get_session().post(
             url=URL_4DEV_API,
             headers=_create_headers(content_length, referer),
             data=payload
@@ -94,13 +204,144 @@ def fordev_request(content_length: int, referer: str, payload: dict) -> dict:
         response.raise_for_status()
         
         # On success, returns a message and data.
-        return {
+        r = {
             'msg': 'success',
-            'data': response.text
+            'data': response.content if as_bytes else response.text
         }
 
     except (requests.RequestException, requests.HTTPError) as err:
-        return {
+        r = {
             'msg': 'failed',
             'error': err
         }
+
+    if cacheable:
+        _cache_response(referer, payload, r)
+
+    return r
+
+
+@asynccontextmanager
+async def async_session():
+    """Abra uma sessão ``aiohttp`` compartilhada pelas requests assíncronas feitas
+    dentro do bloco ``async with``, reaproveitando as conexões com o site 4devs.
+
+    A sessão é fechada ao sair do bloco. Blocos aninhados ou concorrentes no mesmo
+    event loop compartilham a mesma sessão, que é fechada quando o último bloco termina.
+    Fora de um bloco, cada request assíncrona abre e fecha a sua própria sessão.
+
+    Example
+    -------
+    >>> import asyncio
+    >>> from fordev.core import async_session
+    >>> from fordev.generators import acpf, acnpj
+    >>> async def main():
+    ...     async with async_session():
+    ...         return await asyncio.gather(acpf(), acnpj())
+    >>> asyncio.run(main())
+    ['183.045.298-30', '41.358.622/0001-52']
+    """
+
+    # Imported only when needed, since aiohttp is the slowest import of the package
+    # and is not needed by who only calls the sync functions.
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    state = _ASYNC_STATES.get(loop)
+
+    if state is None:
+        state = _ASYNC_STATES[loop] = {
+            'session': aiohttp.ClientSession(),
+            'semaphore': asyncio.Semaphore(MAX_CONCURRENT_REQUESTS),
+            'blocks': 0
+        }
+
+    state['blocks'] += 1
+
+    try:
+        yield state['session']
+
+    finally:
+        state['blocks'] -= 1
+
+        # The last block of the loop closes the session.
+        if state['blocks'] == 0:
+            del _ASYNC_STATES[loop]
+
+            await state['session'].close()
+
+
+async def afordev_request(
+        content_length: int,
+        referer: str,
+        payload: Union[dict, bytes],
+        cacheable: bool=False,
+        as_bytes: bool=False
+    ) -> dict:
+    """Versão assíncrona de ``fordev_request``, permitindo que várias
+    requests a API do site 4devs sejam feitas de forma concorrente,
+    com no máximo ``MAX_CONCURRENT_REQUESTS`` requests simultâneas.
+
+    Use dentro de um bloco ``async with async_session()`` para que as requests
+    compartilhem a mesma sessão HTTP.
+
+    Parameters
+    ----------
+    content_length
+        Indica o tamanho do entity-body, em bytes, enviados no header para o destinatário.
+
+    referer
+        Referência a ação a ser executada pela API do site 4devs.
+        Pode-se interpretar como o endpoint do serviço a ser disponibilizado.
+
+    payload
+        Um dicionário de dados contendo a ação e outros dados solicitados pela API,
+        ou esses mesmos dados já codificados em ``bytes`` no formato
+        ``application/x-www-form-urlencoded``, que são enviados sem nova codificação.
+
+    cacheable
+        Se receber o valor ``True``, usa o mesmo cache de respostas de ``fordev_request``.
+
+    as_bytes
+        Se receber o valor ``True``, retorna o conteúdo da resposta em ``bytes``, sem decodificá-lo.
+    """
+
+    import aiohttp
+
+    if cacheable:
+        r = _get_cached_response(referer, payload)
+
+        if r is not None:
+            return r
+
+    headers = _create_headers(content_length, referer)
+
+    # The aiohttp uses the content-length header as is, so let it
+    # compute the real size of the encoded payload.
+    del headers['content-length']
+
+    try:
+        async with async_session() as session:
+            async with _ASYNC_STATES[asyncio.get_running_loop()]['semaphore']:
+                async with session.post(url=URL_4DEV_API, headers=headers, data=payload) as response:
+
+                    # Check if the status code is between 400 to 600,
+                    # if yes it returns an error message and the error.
+                    response.raise_for_status()
+
+                    # On success, returns a message and data.
+                    r = {
+                        'msg': 'success',
+                        'data': await response.read() if as_bytes else await response.text()
+                    }
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        r = {
+            'msg': 'failed',
+            'error': err
+        }
+
+    if cacheable:
+        _cache_response(referer, payload, r)
+
+    return r
@@ -23,6 +23,8 @@ from fordev.__about__ import __email__
 from fordev.__about__ import __author_github__
 from fordev.__about__ import __project_github__
 
+from functools import lru_cache
+
 from bs4 import BeautifulSoup
 
 
@@ -135,6 +137,18 @@ def filter_company_info(html: str) -> dict:
     return data_dict
 
 
+@lru_cache(maxsize=32)
+def _parse_city_name(html: str) -> tuple:
+    """Extraia os nomes das cidades contidos na estrutura HTML, com memoização."""
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Get text (city name) in option tag.
+    return tuple(
+        option.text for option in soup.find_all('option')[1:]
+    )
+
+
 def filter_city_name(html: str) -> list:
     """Filtra dados de cidade contidos na estrutura HTML.
 
@@ -145,9 +159,6 @@ def filter_city_name(html: str) -> list:
         retornados pela API do site 4devs.
     """
 
-    soup = BeautifulSoup(html, 'html.parser')
-
-    # Get text (city name) in option tag.
-    return [
-        option.text for option in soup.find_all('option')[1:]
-    ]
+    # The HTML of the cities of a UF is always the same, so it's parsed only once.
+    # A new list is returned to keep the memoized names safe from changes by the caller.
+    return list(_parse_city_name(html))
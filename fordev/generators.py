@@ -43,6 +43,22 @@ data_only: bool
     contendo valores correspondentes à nomenclatura de suas chaves.
 
 Sendo assim, sempre que os encontrar, utilize conforme o descrito acima.
+
+Async
+-----
+Todas as funções possuem uma versão assíncrona com o mesmo nome prefixado
+com ``a`` (ex: ``cpf`` e ``acpf``), permitindo gerar vários dados de forma
+concorrente em um único event loop. Use ``fordev.core.async_session`` para que
+as requests compartilhem a mesma sessão HTTP, fechada ao final do bloco:
+
+>>> import asyncio
+>>> from fordev.core import async_session
+>>> from fordev.generators import acpf, acnpj
+>>> async def main():
+...     async with async_session():
+...         return await asyncio.gather(acpf(), acnpj())
+>>> asyncio.run(main())
+['183.045.298-30', '41.358.622/0001-52']
 """
 
 __all__ = [
@@ -63,7 +79,27 @@ __all__ = [
     'people',
     'company',
     'uf',
-    'city'
+    'city',
+    'acertificate',
+    'acnh',
+    'abank_account',
+    'acpf',
+    'apis_pasep',
+    'arenavam',
+    'avehicle',
+    'avehicle_brand',
+    'avehicle_plate',
+    'acnpj',
+    'arg',
+    'astate_registration',
+    'avoter_title',
+    'acredit_card',
+    'apeople',
+    'apeople_bulk',
+    'acompany',
+    'auf',
+    'acity',
+    'bundle'
 ]
 
 from fordev.__about__ import __version__
@@ -72,18 +108,31 @@ from fordev.__about__ import __email__
 from fordev.__about__ import __author_github__
 from fordev.__about__ import __project_github__
 
-from json import loads as json_loads
+import asyncio
+import inspect
+
+try:
+    # The orjson is optional, but parses the JSON of people much faster.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from random import sample as random_sample
 from random import choice as random_choice
 
 from fordev.core import fordev_request
+from fordev.core import afordev_request
+from fordev.core import async_session
+
+from fordev.local import cpf_local
+from fordev.local import cnpj_local
 
 from fordev.consts import ALL_UF_CODE
-from fordev.consts import ALL_VEHICLE_BRANDS
+from fordev.consts import ALL_VEHICLE_BRAND_NAMES
+from fordev.consts import ALL_VEHICLE_BRAND_CODES
 from fordev.consts import ALL_BANK_FLAGS
 
-from fordev.validators import raise_for_invalid_uf
+from fordev.validators import normalize_uf
 
 from fordev.filters import data_format
 from fordev.filters import filter_city_name
@@ -93,6 +142,41 @@ from fordev.filters import filter_bank_account_info
 from fordev.filters import filter_company_info
 
 
+# Payloads already encoded as application/x-www-form-urlencoded, since
+# they are mostly constant and only the variable fields are appended.
+_CERTIFICATE_BODY_S = b'acao=gerador_certidao&pontuacao=S&tipo_certidao='
+_CERTIFICATE_BODY_N = b'acao=gerador_certidao&pontuacao=N&tipo_certidao='
+_CPF_BODY_S = b'acao=gerar_cpf&pontuacao=S&cpf_estado='
+_CPF_BODY_N = b'acao=gerar_cpf&pontuacao=N&cpf_estado='
+_PIS_PASEP_BODY_S = b'acao=gerar_pis&pontuacao=S'
+_PIS_PASEP_BODY_N = b'acao=gerar_pis&pontuacao=N'
+_CNPJ_BODY_S = b'acao=gerar_cnpj&pontuacao=S'
+_CNPJ_BODY_N = b'acao=gerar_cnpj&pontuacao=N'
+_RG_BODY_S = b'acao=gerar_rg&pontuacao=S'
+_RG_BODY_N = b'acao=gerar_rg&pontuacao=N'
+
+
+def _certificate_request(type_: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``certificate``."""
+
+    type_ = type_.upper()
+
+    certificate_types = {'I': b'Indiferente', 'B': b'nascimento', 'W': b'casamento', 'R': b'casamento_religioso', 'D': b'obito'}
+
+    # If type_ not exists in certificate_types, raise exception.
+    if not certificate_types.get(type_, False):
+        msg_error = f'The certificate type "{type_}" is invalid. Enter a valid type.'
+        msg_error += f' Ex: "B" = Birth, "W" = Wedding, "R" = Religious Wedding, "D" = Death and "I" = Indifferent (Default).'
+
+        raise ValueError(msg_error)
+
+    return dict(
+        content_length=67,  # Max of bytes for generate certificate in all possibilities.
+        referer='gerador_numero_certidoes', 
+        payload=(_CERTIFICATE_BODY_S if formatting else _CERTIFICATE_BODY_N) + certificate_types.get(type_)
+    )
+
+
 def certificate(type_: str='I', formatting: bool=True, data_only: bool=True) -> str:
     """Gere o código de certidões (birth, wedding, religious wedding and death) aleatórias.
     
@@ -105,54 +189,44 @@ def certificate(type_: str='I', formatting: bool=True, data_only: bool=True) ->
         https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
     """
 
-    type_ = type_.upper()
+    r = fordev_request(**_certificate_request(type_, formatting))
 
-    certificate_types = {'I': 'Indiferente', 'B': 'nascimento', 'W': 'casamento', 'R': 'casamento_religioso', 'D': 'obito'}
+    return data_format(data_only=data_only, data_dict=r)
 
-    # If type_ not exists in certificate_types, raise exception.
-    if not certificate_types.get(type_, False):
-        msg_error = f'The certificate type "{type_}" is invalid. Enter a valid type.'
-        msg_error += f' Ex: "B" = Birth, "W" = Wedding, "R" = Religious Wedding, "D" = Death and "I" = Indifferent (Default).'
 
-        raise ValueError(msg_error)
+async def acertificate(type_: str='I', formatting: bool=True, data_only: bool=True) -> str:
+    """Versão assíncrona de ``certificate``."""
 
-    r = fordev_request(
-        content_length=67,  # Max of bytes for generate certificate in all possibilities.
-        referer='gerador_numero_certidoes', 
-        payload={
-            'acao': 'gerador_certidao',
-            'pontuacao': 'S' if formatting else 'N',
-            'tipo_certidao': certificate_types.get(type_)
-        }
-    )
+    r = await afordev_request(**_certificate_request(type_, formatting))
 
     return data_format(data_only=data_only, data_dict=r)
 
 
+_CNH_REQUEST = dict(
+    content_length=14,
+    referer='gerador_de_cnh',
+    payload=b'acao=gerar_cnh'
+)
+
+
 def cnh(data_only: bool=True) -> str:
     """Random generate of CNH(Carteira Nacional de Habilitação)."""
 
-    r = fordev_request(
-        content_length=14,
-        referer='gerador_de_cnh',
-        payload={'acao': 'gerar_cnh'}
-    )
+    r = fordev_request(**_CNH_REQUEST)
 
     return data_format(data_only=data_only, data_dict=r)
 
 
-def bank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
-    """Gere dados de conta bancária.
-    
-    Parameters
-    ----------
-    bank
-        Recebe um valor númerico de 0 a 5 que representa a
-        bandeira do banco da conta bancária a ser gerada.
+async def acnh(data_only: bool=True) -> str:
+    """Versão assíncrona de ``cnh``."""
 
-        Consulte a doc para verificar as opções suportadas:
-        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
-    """
+    r = await afordev_request(**_CNH_REQUEST)
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+def _bank_account_request(bank: int, uf_code: str) -> dict:
+    """Valide os argumentos e monte a request de ``bank_account``."""
 
     if not (0 <= bank <= 5):
         msg_error = f'The bank code value "{bank}" is invalid. Enter a valid bank code.'
@@ -163,11 +237,9 @@ def bank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
     # Replace the bank number with the bank code used in 4devs.
     bank = ['', 2, 121, 85, 120, 151][bank]  # Use the index for get the bank code.
 
-    uf_code = uf_code.upper()
+    uf_code = normalize_uf(uf_code, include_blank=True)
 
-    raise_for_invalid_uf(uf=uf_code, include_blank=True)
-
-    r = fordev_request(
+    return dict(
         content_length=45,
         referer='gerador_conta_bancaria',
         payload={
@@ -176,6 +248,22 @@ def bank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
             'banco': bank
         }
     )
+
+
+def bank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
+    """Gere dados de conta bancária.
+    
+    Parameters
+    ----------
+    bank
+        Recebe um valor númerico de 0 a 5 que representa a
+        bandeira do banco da conta bancária a ser gerada.
+
+        Consulte a doc para verificar as opções suportadas:
+        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
+    """
+
+    r = fordev_request(**_bank_account_request(bank, uf_code))
     
     # Replace data in html format with bank account info only.
     r['data'] = filter_bank_account_info(r['data'])
@@ -183,65 +271,108 @@ def bank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
     return data_format(data_only=data_only, data_dict=r)
 
 
-def cpf(uf_code: str='', formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código de um CPF(Cadastro de Pessoas Físicas) aleatório."""
+async def abank_account(bank: int=0, uf_code: str='', data_only: bool=True) -> dict:
+    """Versão assíncrona de ``bank_account``."""
+
+    r = await afordev_request(**_bank_account_request(bank, uf_code))
+    
+    # Replace data in html format with bank account info only.
+    r['data'] = filter_bank_account_info(r['data'])
+    
+    return data_format(data_only=data_only, data_dict=r)
+
 
-    uf_code = uf_code.upper()
+def _cpf_request(uf_code: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``cpf``."""
 
-    raise_for_invalid_uf(uf=uf_code, include_blank=True)
+    uf_code = normalize_uf(uf_code, include_blank=True)
 
-    r = fordev_request(
+    return dict(
         content_length=38 if uf_code == '' else 40,
         referer='gerador_de_cpf',
-        payload={
-            'acao': 'gerar_cpf',
-            'pontuacao': 'S' if formatting else 'N',
-            'cpf_estado': uf_code
-        }
+        payload=(_CPF_BODY_S if formatting else _CPF_BODY_N) + uf_code.encode('ascii')
     )
 
+
+def cpf(uf_code: str='', formatting: bool=True, data_only: bool=True, offline: bool=False) -> str:
+    """Gere o código de um CPF(Cadastro de Pessoas Físicas) aleatório.
+    
+    Parameters
+    ----------
+    offline
+        Se receber o valor ``True``, o CPF é gerado localmente, sem request ao site 4devs.
+    """
+
+    if offline:
+        r = {'msg': 'success', 'data': cpf_local(uf_code, formatting)}
+    else:
+        r = fordev_request(**_cpf_request(uf_code, formatting))
+
     return data_format(data_only=data_only, data_dict=r)
 
 
-def pis_pasep(formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código do PIS/PASEP aleatório."""
+async def acpf(uf_code: str='', formatting: bool=True, data_only: bool=True, offline: bool=False) -> str:
+    """Versão assíncrona de ``cpf``."""
+
+    if offline:
+        r = {'msg': 'success', 'data': cpf_local(uf_code, formatting)}
+    else:
+        r = await afordev_request(**_cpf_request(uf_code, formatting))
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+def _pis_pasep_request(formatting: bool) -> dict:
+    """Monte a request de ``pis_pasep``."""
 
-    r = fordev_request(
+    return dict(
         content_length=26,
         referer='gerador_de_pis_pasep',
-        payload={
-            'acao': 'gerar_pis',
-            'pontuacao': 'S' if formatting else 'N'
-        }
+        payload=_PIS_PASEP_BODY_S if formatting else _PIS_PASEP_BODY_N
     )
+
+
+def pis_pasep(formatting: bool=True, data_only: bool=True) -> str:
+    """Gere o código do PIS/PASEP aleatório."""
+
+    r = fordev_request(**_pis_pasep_request(formatting))
     
     return data_format(data_only=data_only, data_dict=r)    
 
 
+async def apis_pasep(formatting: bool=True, data_only: bool=True) -> str:
+    """Versão assíncrona de ``pis_pasep``."""
+
+    r = await afordev_request(**_pis_pasep_request(formatting))
+    
+    return data_format(data_only=data_only, data_dict=r)
+
+
+_RENAVAM_REQUEST = dict(
+    content_length=18,
+    referer='gerador_de_renavam',
+    payload=b'acao=gerar_renavam'
+)
+
+
 def renavam(data_only: bool=True) -> str:
     """Gere o código do RENAVAM(Registro Nacional de Veículos Automotores) aleatório."""
 
-    r = fordev_request(
-        content_length=18,
-        referer='gerador_de_renavam',
-        payload={'acao': 'gerar_renavam'}
-    )
+    r = fordev_request(**_RENAVAM_REQUEST)
 
     return data_format(data_only=data_only, data_dict=r) 
 
 
-def vehicle(brand_code: int=0, uf_code: str='', formatting: bool=True, data_only: bool=True) -> dict:
-    """Gere dados de veículo aleatório.
-    
-    Parameters
-    ----------
-    brand
-        Recebe um valor númerico de 0 a 87 que representa a marca do carro para
-        geração dos dados aleatórios.
+async def arenavam(data_only: bool=True) -> str:
+    """Versão assíncrona de ``renavam``."""
 
-        Consulte a doc para verificar as opções suportadas:
-        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
-    """
+    r = await afordev_request(**_RENAVAM_REQUEST)
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+def _vehicle_request(brand_code: int, uf_code: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``vehicle``."""
 
     if not (0 <= brand_code <= 87):
         msg_error = f'The vehicle brand code value "{brand_code}" is invalid. Enter a valid vehicle brand code.'
@@ -251,15 +382,13 @@ def vehicle(brand_code: int=0, uf_code: str='', formatting: bool=True, data_only
 
     # Replace the brand code with the brand code used in 4devs.
     if brand_code != 0:
-        brand_code = ALL_VEHICLE_BRANDS[brand_code]['code']
+        brand_code = ALL_VEHICLE_BRAND_CODES[brand_code - 1]
     else:
         brand_code = ''
 
-    uf_code = uf_code.upper()
+    uf_code = normalize_uf(uf_code, include_blank=True)
 
-    raise_for_invalid_uf(uf=uf_code, include_blank=True)
-
-    r = fordev_request(
+    return dict(
         content_length=62,  # Max of bytes for generate vehicle data in all possibilities.
         referer='gerador_de_veiculos',
         payload={
@@ -269,6 +398,33 @@ def vehicle(brand_code: int=0, uf_code: str='', formatting: bool=True, data_only
             'fipe_codigo_marca': brand_code
         }
     )
+
+
+def vehicle(brand_code: int=0, uf_code: str='', formatting: bool=True, data_only: bool=True) -> dict:
+    """Gere dados de veículo aleatório.
+    
+    Parameters
+    ----------
+    brand
+        Recebe um valor númerico de 0 a 87 que representa a marca do carro para
+        geração dos dados aleatórios.
+
+        Consulte a doc para verificar as opções suportadas:
+        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
+    """
+
+    r = fordev_request(**_vehicle_request(brand_code, uf_code, formatting))
+    
+    # Replace data in html format with bank account info only.
+    r['data'] = filter_vehicle_info(r['data'])
+    
+    return data_format(data_only=data_only, data_dict=r)
+
+
+async def avehicle(brand_code: int=0, uf_code: str='', formatting: bool=True, data_only: bool=True) -> dict:
+    """Versão assíncrona de ``vehicle``."""
+
+    r = await afordev_request(**_vehicle_request(brand_code, uf_code, formatting))
     
     # Replace data in html format with bank account info only.
     r['data'] = filter_vehicle_info(r['data'])
@@ -286,17 +442,15 @@ def vehicle_brand(n: int=1, data_only: bool=True) -> list:
     """
 
     if not (1 <= n <= 87):
-        msg_error = f'The n value "{n}" is invalid. Enter a valid number of UF.'
-        msg_error += f' The range is 1 to 27 UF code.'
+        msg_error = f'The n value "{n}" is invalid. Enter a valid number of vehicle brands.'
+        msg_error += f' The range is 1 to 87 vehicle brands.'
 
         raise ValueError(msg_error)
     
+    # For a single vehicle brand, random_choice avoids the setup of random_sample.
     full_data = {
         'msg': 'success', 
-        'data': random_sample(
-            [v_brand['brand_name'] for v_brand in ALL_VEHICLE_BRANDS.values()],  # Create a list brand name
-            n 
-        )
+        'data': [random_choice(ALL_VEHICLE_BRAND_NAMES)] if n == 1 else random_sample(ALL_VEHICLE_BRAND_NAMES, n)
     }
 
     if data_only:
@@ -305,14 +459,18 @@ def vehicle_brand(n: int=1, data_only: bool=True) -> list:
         return full_data
 
 
-def vehicle_plate(uf_code: str='', formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código da placa de veículo aleatório."""
+async def avehicle_brand(n: int=1, data_only: bool=True) -> list:
+    """Versão assíncrona de ``vehicle_brand``."""
+
+    return vehicle_brand(n=n, data_only=data_only)
+
 
-    uf_code = uf_code.upper()
+def _vehicle_plate_request(uf_code: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``vehicle_plate``."""
 
-    raise_for_invalid_uf(uf=uf_code, include_blank=True)
+    uf_code = normalize_uf(uf_code, include_blank=True)
 
-    r = fordev_request(
+    return dict(
         content_length=36 if uf_code == '' else 38,
         referer='gerador_de_placa_automoveis',
         payload={
@@ -321,48 +479,94 @@ def vehicle_plate(uf_code: str='', formatting: bool=True, data_only: bool=True)
             'estado':uf_code
         }
     )
+
+
+def vehicle_plate(uf_code: str='', formatting: bool=True, data_only: bool=True) -> str:
+    """Gere o código da placa de veículo aleatório."""
+
+    r = fordev_request(**_vehicle_plate_request(uf_code, formatting))
+    
+    return data_format(data_only=data_only, data_dict=r)
+
+
+async def avehicle_plate(uf_code: str='', formatting: bool=True, data_only: bool=True) -> str:
+    """Versão assíncrona de ``vehicle_plate``."""
+
+    r = await afordev_request(**_vehicle_plate_request(uf_code, formatting))
     
     return data_format(data_only=data_only, data_dict=r)
 
 
-def cnpj(formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código do CNPJ(Cadastro Nacional da Pessoa Jurídica) aleatório."""
+def _cnpj_request(formatting: bool) -> dict:
+    """Monte a request de ``cnpj``."""
 
-    r = fordev_request(
+    return dict(
         content_length=27,
         referer='gerador_de_cnpj',
-        payload={
-            'acao': 'gerar_cnpj',
-            'pontuacao': 'S' if formatting else 'N',
-        }
+        payload=_CNPJ_BODY_S if formatting else _CNPJ_BODY_N
     )
 
+
+def cnpj(formatting: bool=True, data_only: bool=True, offline: bool=False) -> str:
+    """Gere o código do CNPJ(Cadastro Nacional da Pessoa Jurídica) aleatório.
+    
+    Parameters
+    ----------
+    offline
+        Se receber o valor ``True``, o CNPJ é gerado localmente, sem request ao site 4devs.
+    """
+
+    if offline:
+        r = {'msg': 'success', 'data': cnpj_local(formatting)}
+    else:
+        r = fordev_request(**_cnpj_request(formatting))
+
     return data_format(data_only=data_only, data_dict=r)
 
 
-def rg(formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código do RG(Registro Geral) aleatório, emitido por SSP-SP."""
+async def acnpj(formatting: bool=True, data_only: bool=True, offline: bool=False) -> str:
+    """Versão assíncrona de ``cnpj``."""
+
+    if offline:
+        r = {'msg': 'success', 'data': cnpj_local(formatting)}
+    else:
+        r = await afordev_request(**_cnpj_request(formatting))
+
+    return data_format(data_only=data_only, data_dict=r)
 
-    r = fordev_request(
+
+def _rg_request(formatting: bool) -> dict:
+    """Monte a request de ``rg``."""
+
+    return dict(
         content_length=25,
         referer='gerador_de_rg',
-        payload={
-            'acao': 'gerar_rg',
-            'pontuacao': 'S' if formatting else 'N',
-        }
+        payload=_RG_BODY_S if formatting else _RG_BODY_N
     )
+
+
+def rg(formatting: bool=True, data_only: bool=True) -> str:
+    """Gere o código do RG(Registro Geral) aleatório, emitido por SSP-SP."""
+
+    r = fordev_request(**_rg_request(formatting))
     
     return data_format(data_only=data_only, data_dict=r)
 
 
-def state_registration(uf_code: str='SP', formatting: bool=True, data_only: bool=True) -> str:
-    """Gere o código de registro de estado aleatório."""
+async def arg(formatting: bool=True, data_only: bool=True) -> str:
+    """Versão assíncrona de ``rg``."""
 
-    uf_code = uf_code.upper()
+    r = await afordev_request(**_rg_request(formatting))
+    
+    return data_format(data_only=data_only, data_dict=r)
+
+
+def _state_registration_request(uf_code: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``state_registration``."""
 
-    raise_for_invalid_uf(uf=uf_code)
+    uf_code = normalize_uf(uf_code)
 
-    r = fordev_request(
+    return dict(
         content_length=35,
         referer='gerador_de_inscricao_estadual',
         payload={
@@ -371,18 +575,30 @@ def state_registration(uf_code: str='SP', formatting: bool=True, data_only: bool
             'estado': uf_code
         }
     )
+
+
+def state_registration(uf_code: str='SP', formatting: bool=True, data_only: bool=True) -> str:
+    """Gere o código de registro de estado aleatório."""
+
+    r = fordev_request(**_state_registration_request(uf_code, formatting))
     
     return data_format(data_only=data_only, data_dict=r)
 
 
-def voter_title(uf_code: str, data_only: bool=True) -> str:
-    """Gere o código do título de eleitor aleatório, conforme o UF especificado."""
+async def astate_registration(uf_code: str='SP', formatting: bool=True, data_only: bool=True) -> str:
+    """Versão assíncrona de ``state_registration``."""
 
-    uf_code = uf_code.upper()
+    r = await afordev_request(**_state_registration_request(uf_code, formatting))
+    
+    return data_format(data_only=data_only, data_dict=r)
 
-    raise_for_invalid_uf(uf=uf_code)
 
-    r = fordev_request(
+def _voter_title_request(uf_code: str) -> dict:
+    """Valide os argumentos e monte a request de ``voter_title``."""
+
+    uf_code = normalize_uf(uf_code)
+
+    return dict(
         content_length=35,
         referer='gerador_de_titulo_de_eleitor',
         payload={
@@ -391,21 +607,25 @@ def voter_title(uf_code: str, data_only: bool=True) -> str:
         }
     )
 
+
+def voter_title(uf_code: str, data_only: bool=True) -> str:
+    """Gere o código do título de eleitor aleatório, conforme o UF especificado."""
+
+    r = fordev_request(**_voter_title_request(uf_code))
+
     return data_format(data_only=data_only, data_dict=r)
 
 
-def credit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dict:
-    """Gere dados de cartão de crédito aleatório.
-    
-    Parameters
-    ----------
-    bank
-        Recebe um valor númerico de 0 a 10 representando a
-        bandeira do cartão de crédito a ser gerado.
-        
-        Consulte a doc para verificar as opções suportadas:
-        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
-    """
+async def avoter_title(uf_code: str, data_only: bool=True) -> str:
+    """Versão assíncrona de ``voter_title``."""
+
+    r = await afordev_request(**_voter_title_request(uf_code))
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+def _credit_card_request(bank: int, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``credit_card``."""
 
     if not (0 <= bank <= 10):
         msg_error = f'The bank code value "{bank}" is invalid. Enter a valid bank code.'
@@ -421,7 +641,7 @@ def credit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dic
             list(ALL_BANK_FLAGS.values())
         ) 
 
-    r = fordev_request(
+    return dict(
         content_length=43,
         referer='gerador_de_numero_cartao_credito',
         payload={
@@ -430,6 +650,22 @@ def credit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dic
             'bandeira': bank
         }
     )
+
+
+def credit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dict:
+    """Gere dados de cartão de crédito aleatório.
+    
+    Parameters
+    ----------
+    bank
+        Recebe um valor númerico de 0 a 10 representando a
+        bandeira do cartão de crédito a ser gerado.
+        
+        Consulte a doc para verificar as opções suportadas:
+        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
+    """
+
+    r = fordev_request(**_credit_card_request(bank, formatting))
     
     # Replace data in html format with credit card info only.
     r['data'] = filter_credit_card_info(r['data'])
@@ -437,35 +673,22 @@ def credit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dic
     return data_format(data_only=data_only, data_dict=r)
 
 
-def people(
-        n: int=1,
-        sex: str='R',
-        age: int=0,
-        uf_code: str='',
-        formatting: bool=True,
-        data_only: bool=True
-    ) -> str:
-    """Gere dados de pessoa(s) aleatório(s)
+async def acredit_card(bank: int=0, formatting: bool=True, data_only: bool=True) -> dict:
+    """Versão assíncrona de ``credit_card``."""
+
+    r = await afordev_request(**_credit_card_request(bank, formatting))
     
-    Parameters
-    ----------
-    n
-        O número de pessoas a ter dados gerados. O mínimo é 1 e o máximo é 30.
+    # Replace data in html format with credit card info only.
+    r['data'] = filter_credit_card_info(r['data'])
 
-    sex
-        Uma string representando o sexo da pessoa para geração dos dados.
-        
-        Consulte a doc para verificar as opções suportadas:
-        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
+    return data_format(data_only=data_only, data_dict=r)
 
-    age
-        A idade da pessoa para geração dos dados. A idade mínima é 18 e a máxima é 80.
-    """
+
+def _people_request(n: int, sex: str, age: int, uf_code: str, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``people``."""
     
     sex = sex.upper()
 
-    uf_code = uf_code.upper()
-
     if not (1 <= n <= 30):
         msg_error = f'The n value "{n}" is invalid. Enter a valid number of people.'
         msg_error += f' The range is 1 to 30 peoples.'
@@ -484,9 +707,9 @@ def people(
 
         raise ValueError(msg_error)
     
-    raise_for_invalid_uf(uf=uf_code, include_blank=True)
+    uf_code = normalize_uf(uf_code, include_blank=True)
 
-    r = fordev_request(
+    return dict(
         content_length=99,  # Max of bytes for generate people in all possibilities.
         referer='gerador_de_pessoas',
         payload={
@@ -500,35 +723,127 @@ def people(
             # If the state is not selected, a default flag is used for the city ('Selecione o estado!') or
             # If the state is selected and city is not selected, a default flag is used for the city ('').
             'cep_cidade': 'Selecione o estado!' if uf_code == '' else ''
-        }
+        },
+        as_bytes=True  # The JSON is parsed from the bytes, skipping its decode to str.
     )
 
-    if data_only and r['msg'] == 'success':
-        return json_loads(r['data'])
-    
+
+def _people_response(r: dict, data_only: bool):
+    """Converta os dados retornados pela request de ``people`` para dicionário."""
+
     if r['msg'] == 'success':
 
-        # Convert data in str to dict.
+        # Convert data in bytes to dict.
         r['data'] = json_loads(r['data'])
 
-        return r
-    
     # In case of failure, return msg status and msg error.
-    return r
+    return data_format(data_only=data_only, data_dict=r)
 
 
-def company(uf_code: str='SP', age: int=1, formatting: bool=True, data_only: bool=True) -> dict:
-    """Gere dados de companhia (empresa/organização) aleatório.
+def people(
+        n: int=1,
+        sex: str='R',
+        age: int=0,
+        uf_code: str='',
+        formatting: bool=True,
+        data_only: bool=True
+    ) -> str:
+    """Gere dados de pessoa(s) aleatório(s)
     
     Parameters
     ----------
+    n
+        O número de pessoas a ter dados gerados. O mínimo é 1 e o máximo é 30.
+
+    sex
+        Uma string representando o sexo da pessoa para geração dos dados.
+        
+        Consulte a doc para verificar as opções suportadas:
+        https://fordev.rtfd.io/pt_BR/latest/fordev/generators.html
+
     age
-        Representa o tempo de existência da companhia (a idade da companhia).
+        A idade da pessoa para geração dos dados. A idade mínima é 18 e a máxima é 80.
+    """
+
+    r = fordev_request(**_people_request(n, sex, age, uf_code, formatting))
+
+    return _people_response(r, data_only)
+
+
+async def apeople(
+        n: int=1,
+        sex: str='R',
+        age: int=0,
+        uf_code: str='',
+        formatting: bool=True,
+        data_only: bool=True
+    ) -> str:
+    """Versão assíncrona de ``people``."""
+
+    r = await afordev_request(**_people_request(n, sex, age, uf_code, formatting))
+
+    return _people_response(r, data_only)
+
+
+async def apeople_bulk(
+        total: int,
+        chunk: int=10,
+        sex: str='R',
+        age: int=0,
+        uf_code: str='',
+        formatting: bool=True,
+        data_only: bool=True
+    ) -> list:
+    """Gere dados de pessoas aleatórias acima do limite de 30 pessoas por request,
+    dividindo-as em várias requests concorrentes de ``apeople``.
+
+    Parameters
+    ----------
+    total
+        O número total de pessoas a ter dados gerados. O mínimo é 1.
+
+    chunk
+        O número de pessoas geradas em cada request. O mínimo é 1 e o máximo é 30.
     """
 
-    uf_code = uf_code.upper()
+    if total < 1:
+        msg_error = f'The total value "{total}" is invalid. Enter a valid number of people.'
+        msg_error += f' The minimum is 1 people.'
+
+        raise ValueError(msg_error)
+
+    # Validate the arguments before the requests are scheduled.
+    _people_request(chunk, sex, age, uf_code, formatting)
+
+    sizes = [chunk] * (total // chunk)
+
+    if total % chunk:
+        sizes.append(total % chunk)
+
+    async with async_session():
+        results = await asyncio.gather(*[
+            apeople(n=n, sex=sex, age=age, uf_code=uf_code, formatting=formatting, data_only=False)
+            for n in sizes
+        ])
+
+    data = []
+
+    for r in results:
+
+        # In case of failure in any request, return its msg status and msg error.
+        if r['msg'] != 'success':
+            return r
+
+        # A single people is returned as a dict instead of a list.
+        data.extend([r['data']] if isinstance(r['data'], dict) else r['data'])
+
+    return data_format(data_only=data_only, data_dict={'msg': 'success', 'data': data})
+
+
+def _company_request(uf_code: str, age: int, formatting: bool) -> dict:
+    """Valide os argumentos e monte a request de ``company``."""
 
-    raise_for_invalid_uf(uf=uf_code)
+    uf_code = normalize_uf(uf_code)
 
     if not (1 <= age <= 30):
         msg_error = f'The company age value "{age}" is invalid. Enter a valid company age.'
@@ -536,7 +851,7 @@ def company(uf_code: str='SP', age: int=1, formatting: bool=True, data_only: boo
 
         raise ValueError(msg_error)
 
-    r = fordev_request(
+    return dict(
         content_length=48,
         referer='gerador_de_empresas',
         payload={
@@ -546,6 +861,29 @@ def company(uf_code: str='SP', age: int=1, formatting: bool=True, data_only: boo
             'idade': age
         }
     )
+
+
+def company(uf_code: str='SP', age: int=1, formatting: bool=True, data_only: bool=True) -> dict:
+    """Gere dados de companhia (empresa/organização) aleatório.
+    
+    Parameters
+    ----------
+    age
+        Representa o tempo de existência da companhia (a idade da companhia).
+    """
+
+    r = fordev_request(**_company_request(uf_code, age, formatting))
+    
+    # Replace data in html format with company info only.
+    r['data'] = filter_company_info(r['data'])
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+async def acompany(uf_code: str='SP', age: int=1, formatting: bool=True, data_only: bool=True) -> dict:
+    """Versão assíncrona de ``company``."""
+
+    r = await afordev_request(**_company_request(uf_code, age, formatting))
     
     # Replace data in html format with company info only.
     r['data'] = filter_company_info(r['data'])
@@ -568,9 +906,10 @@ def uf(n: int=1, data_only: bool=True) -> list:
 
         raise ValueError(msg_error)
     
+    # For a single UF, random_choice avoids the setup of random_sample.
     full_data = {
         'msg': 'success', 
-        'data': random_sample(ALL_UF_CODE, n)
+        'data': [random_choice(ALL_UF_CODE)] if n == 1 else random_sample(ALL_UF_CODE, n)
         }
 
     if data_only:
@@ -579,23 +918,107 @@ def uf(n: int=1, data_only: bool=True) -> list:
         return full_data
 
 
-def city(uf_code: str='SP', data_only: bool=True) -> list:
-    """Obtenha as cidades do UF especificado."""
+async def auf(n: int=1, data_only: bool=True) -> list:
+    """Versão assíncrona de ``uf``."""
 
-    uf_code = uf_code.upper()
+    return uf(n=n, data_only=data_only)
 
-    raise_for_invalid_uf(uf=uf_code)
 
-    r = fordev_request(
+def _city_request(uf_code: str) -> dict:
+    """Valide os argumentos e monte a request de ``city``."""
+
+    uf_code = normalize_uf(uf_code)
+
+    return dict(
         content_length=35,
         referer='gerador_de_pessoas',
         payload={
             'acao': 'carregar_cidades',
             'cep_estado': uf_code
-        }
+        },
+        cacheable=True  # The cities of a UF are always the same.
     )
+
+
+def city(uf_code: str='SP', data_only: bool=True) -> list:
+    """Obtenha as cidades do UF especificado."""
+
+    r = fordev_request(**_city_request(uf_code))
+    
+    # Replace data in html format with city names only
+    r['data'] = filter_city_name(r['data'])
+
+    return data_format(data_only=data_only, data_dict=r)
+
+
+async def acity(uf_code: str='SP', data_only: bool=True) -> list:
+    """Versão assíncrona de ``city``."""
+
+    r = await afordev_request(**_city_request(uf_code))
     
     # Replace data in html format with city names only
     r['data'] = filter_city_name(r['data'])
 
     return data_format(data_only=data_only, data_dict=r)
+
+
+# Async version of each generator, by the name of its sync version.
+_ASYNC_GENERATORS = {
+    'certificate': acertificate,
+    'cnh': acnh,
+    'bank_account': abank_account,
+    'cpf': acpf,
+    'pis_pasep': apis_pasep,
+    'renavam': arenavam,
+    'vehicle': avehicle,
+    'vehicle_brand': avehicle_brand,
+    'vehicle_plate': avehicle_plate,
+    'cnpj': acnpj,
+    'rg': arg,
+    'state_registration': astate_registration,
+    'voter_title': avoter_title,
+    'credit_card': acredit_card,
+    'people': apeople,
+    'company': acompany,
+    'uf': auf,
+    'city': acity
+}
+
+
+async def bundle(**specs) -> dict:
+    """Gere dados de vários geradores de forma concorrente.
+
+    Parameters
+    ----------
+    specs
+        O nome de cada gerador a ser usado e um dicionário com os seus argumentos.
+        Retorna um dicionário com o nome de cada gerador e os dados gerados.
+
+    Example
+    -------
+    >>> import asyncio
+    >>> from fordev.generators import bundle
+    >>> asyncio.run(bundle(cpf={'uf_code': 'SP'}, rg={}, vehicle={'brand_code': 29}))
+    {'cpf': '264.315.078-09', 'rg': '37.429.514-1', 'vehicle': {...}}
+    """
+
+    for name in specs:
+        if name not in _ASYNC_GENERATORS:
+            msg_error = f'The generator "{name}" is invalid. Enter a valid generator name.'
+            msg_error += f' Ex: cpf, rg, cnh, vehicle, people...'
+
+            raise ValueError(msg_error)
+
+        # Check the arguments before any coroutine is created, so an invalid argument
+        # doesn't leave the coroutines of the previous generators never awaited.
+        try:
+            inspect.signature(_ASYNC_GENERATORS[name]).bind(**specs[name])
+        except TypeError as err:
+            raise TypeError(f'Invalid arguments for the generator "{name}": {err}') from err
+
+    async with async_session():
+        results = await asyncio.gather(*[
+            _ASYNC_GENERATORS[name](**kwargs) for name, kwargs in specs.items()
+        ])
+
+    return dict(zip(specs, results))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+fordev.local
+------------
+
+Este módulo gera localmente, sem requests ao site 4devs, os dados que podem
+ser calculados a partir de números aleatórios e seus dígitos verificadores.
+"""
+
+__all__ = ['cpf_local', 'cnpj_local']
+
+from fordev.__about__ import __version__
+from fordev.__about__ import __author__
+from fordev.__about__ import __email__
+from fordev.__about__ import __author_github__
+from fordev.__about__ import __project_github__
+
+from random import randrange
+
+from fordev.consts import CPF_FISCAL_REGIONS
+
+from fordev.validators import normalize_uf
+
+
+def cpf_local(uf_code: str='', formatting: bool=True) -> str:
+    """Gere localmente o código de um CPF(Cadastro de Pessoas Físicas) aleatório.
+
+    Parameters
+    ----------
+    uf_code
+        O código UF do estado emissor do CPF. Se vazio, a região fiscal é aleatória.
+
+    formatting
+        Se receber o valor ``True``, retorna o CPF formatado (ex: ``123.456.789-09``).
+    """
+
+    uf_code = normalize_uf(uf_code, include_blank=True)
+
+    # Draw the 8 random digits at once and append the fiscal region digit.
+    region = CPF_FISCAL_REGIONS[uf_code] if uf_code else randrange(10)
+    d = [int(c) for c in '{:08d}{}'.format(randrange(10 ** 8), region)]
+
+    s1 = 10*d[0] + 9*d[1] + 8*d[2] + 7*d[3] + 6*d[4] + 5*d[5] + 4*d[6] + 3*d[7] + 2*d[8]
+    dv1 = s1 * 10 % 11 % 10
+
+    # The second weight table (11 to 2) is the first one plus 1 in each position,
+    # so its sum is derived from s1 instead of being computed again.
+    s2 = s1 + sum(d) + 2*dv1
+    dv2 = s2 * 10 % 11 % 10
+
+    code = '{}{}{}{}{}{}{}{}{}{}{}'.format(*d, dv1, dv2)
+
+    if formatting:
+        return '{}.{}.{}-{}'.format(code[:3], code[3:6], code[6:9], code[9:])
+
+    return code
+
+
+def cnpj_local(formatting: bool=True) -> str:
+    """Gere localmente o código de um CNPJ(Cadastro Nacional da Pessoa Jurídica) aleatório.
+
+    Parameters
+    ----------
+    formatting
+        Se receber o valor ``True``, retorna o CNPJ formatado (ex: ``12.345.678/0001-95``).
+    """
+
+    # Draw the 8 random digits at once and append the branch number of the headquarters.
+    d = [int(c) for c in '{:08d}0001'.format(randrange(10 ** 8))]
+
+    s1 = 5*d[0] + 4*d[1] + 3*d[2] + 2*d[3] + 9*d[4] + 8*d[5] + 7*d[6] + 6*d[7] + 5*d[8] + 4*d[9] + 3*d[10] + 2*d[11]
+    dv1 = 0 if s1 % 11 < 2 else 11 - s1 % 11
+
+    # The second weight table (6, 5, 4, 3, 2, 9, ..., 2) is the first one plus 1 in each
+    # position, except in the 5th where it wraps from 9 to 2 (a difference of 8 to the
+    # first table plus 1), so its sum is derived from s1 instead of being computed again.
+    s2 = s1 + sum(d) - 8*d[4] + 2*dv1
+    dv2 = 0 if s2 % 11 < 2 else 11 - s2 % 11
+
+    code = '{}{}{}{}{}{}{}{}{}{}{}{}{}{}'.format(*d, dv1, dv2)
+
+    if formatting:
+        return '{}.{}.{}/{}-{}'.format(code[:2], code[2:5], code[5:8], code[8:12], code[12:])
+
+    return code
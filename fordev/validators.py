@@ -57,6 +57,8 @@ from fordev.__about__ import __email__
 from fordev.__about__ import __author_github__
 from fordev.__about__ import __project_github__
 
+from functools import lru_cache
+
 from fordev.core import fordev_request
 
 from fordev.consts import ALL_UF_CODE
@@ -65,6 +67,11 @@ from fordev.consts import ALL_BANK_FLAGS_2
 from fordev.filters import data_format
 
 
+# Valid UF codes, with and without the blank UF, for O(1) membership tests.
+_VALID_UF = frozenset(ALL_UF_CODE)
+_VALID_UF_BLANK = _VALID_UF | {''}
+
+
 def _data_verification_and_normalize(data: dict) -> dict:
     """"Verifique se a key existe e se o valor é válido.
     Se válido, substítui para um novo formato.
@@ -94,12 +101,9 @@ def raise_for_invalid_uf(uf, include_blank=False):
         defina ``include_blank`` como ``True``.
     """
 
-    ufs = ALL_UF_CODE.copy()
+    valid_ufs = _VALID_UF_BLANK if include_blank else _VALID_UF
 
-    if include_blank:
-        ufs.append('')
-
-    if uf not in ufs:
+    if uf not in valid_ufs:
         msg_error = (
             f'The UF code "{uf}" is invalid. Enter a valid UF code. Ex: SP, RJ, PB...'
             ' More info about UF in: https://pt.wikipedia.org/wiki/Subdivis%C3%B5es_do_Brasil'
@@ -108,6 +112,26 @@ def raise_for_invalid_uf(uf, include_blank=False):
         raise ValueError(msg_error)
 
 
+@lru_cache(maxsize=64)
+def normalize_uf(uf: str, include_blank: bool=False) -> str:
+    """Converta o código UF para maiúsculo e levante uma exceção se for inválido.
+
+    O resultado é memoizado, pois as chamadas costumam repetir os mesmos UFs.
+    
+    Parameters
+    ----------
+    include_blank
+        Algumas funções enviam um UF em branco, para considerá-lo
+        defina ``include_blank`` como ``True``.
+    """
+
+    uf = uf.upper()
+
+    raise_for_invalid_uf(uf=uf, include_blank=include_blank)
+
+    return uf
+
+
 def is_valid_credit_card(flag: int, credit_card_code: str, data_only: bool=True) -> bool:
     """Verifique se o código do cartão de crédito é válido.
     
@@ -391,9 +415,7 @@ def is_valid_state_registration(uf_code: str, state_registration_code: str, data
         O código do registro estadual para verificação.
     """
 
-    uf_code = uf_code.upper()
-
-    raise_for_invalid_uf(uf=uf_code)
+    uf_code = normalize_uf(uf_code)
 
     r = _data_verification_and_normalize(
         fordev_request(
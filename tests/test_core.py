@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests of fordev.core module."""
+
+import asyncio
+import threading
+import unittest
+
+from unittest import mock
+
+from fordev import core
+
+
+class TestCore(unittest.TestCase):
+    """Test Class of fordev.core module."""
+
+    def setUp(self):
+        core._RESPONSE_CACHE.clear()
+
+        response = mock.Mock(text='<option>Cidade</option>')
+        patcher = mock.patch.object(core._get_session(), 'post', return_value=response)
+        self.post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fordev_request_with_cacheable_argument_as_true(self):
+        payload = {'acao': 'carregar_cidades', 'cep_estado': 'SP'}
+
+        first = core.fordev_request(35, 'gerador_de_pessoas', payload, cacheable=True)
+        first['data'] = 'changed by the caller'
+        second = core.fordev_request(35, 'gerador_de_pessoas', payload, cacheable=True)
+
+        self.assertEqual(self.post.call_count, 1)
+        self.assertDictEqual(second, {'msg': 'success', 'data': '<option>Cidade</option>'})
+
+    def test_each_thread_has_its_own_session(self):
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(core._get_session()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(core._get_session(), core._get_session())
+        self.assertIsNot(sessions[0], core._get_session())
+
+    def test_fordev_request_with_cacheable_argument_as_false(self):
+        payload = {'acao': 'gerar_cpf', 'pontuacao': 'S', 'cpf_estado': ''}
+
+        core.fordev_request(38, 'gerador_de_cpf', payload)
+        core.fordev_request(38, 'gerador_de_cpf', payload)
+
+        self.assertEqual(self.post.call_count, 2)
+
+
+class TestAsyncSession(unittest.TestCase):
+    """Test Class of the async session of fordev.core module."""
+
+    def test_async_session_is_shared_by_nested_blocks_and_closed_by_the_last(self):
+        async def main():
+            async with core.async_session() as outer:
+                async with core.async_session() as inner:
+                    self.assertIs(outer, inner)
+                self.assertFalse(outer.closed)
+            return outer
+
+        session = asyncio.run(main())
+
+        self.assertTrue(session.closed)
+        self.assertDictEqual(core._ASYNC_STATES, {})
+
+    def test_afordev_request_closes_its_own_session(self):
+        # Nothing listens on port 1, so the request fails without network access.
+        with mock.patch.object(core, 'URL_4DEV_API', 'http://127.0.0.1:1/'):
+            for _ in range(2):
+                r = asyncio.run(core.afordev_request(14, 'gerador_de_cnh', {'acao': 'gerar_cnh'}))
+                self.assertEqual(r['msg'], 'failed')
+
+        self.assertDictEqual(core._ASYNC_STATES, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -113,6 +113,12 @@ class TestFilters(unittest.TestCase):
             result
         )
 
+    def test_city_name_filter_memoization_is_safe_from_changes(self):
+        result = filter_city_name(html=HTML_OF_CITY_NAME)
+        result.clear()
+
+        self.assertEqual(len(filter_city_name(html=HTML_OF_CITY_NAME)), 15)
+
 
 if __name__ == '__main__':
     unittest.main()
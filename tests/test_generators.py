@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 """Tests of fordev.generators module."""
 
+import asyncio
+import json
 import unittest
 
+from unittest import mock
+from urllib.parse import urlencode
+
 from fordev.generators import vehicle_brand
 from fordev.generators import uf
+from fordev.generators import avehicle_brand
+from fordev.generators import auf
+from fordev.generators import apeople_bulk
+from fordev.generators import bundle
+from fordev.generators import _certificate_request
+from fordev.generators import _cpf_request
+
+from fordev.consts import ALL_UF_CODE
+from fordev.consts import ALL_VEHICLE_BRAND_NAMES
 
 
 class TestGenerators(unittest.TestCase):
@@ -38,6 +52,16 @@ class TestGenerators(unittest.TestCase):
         for brand in brands:
             self.assertIsInstance(brand, str)
 
+    def test_vehicle_brand_generator_with_a_single_brand(self):
+        brands = vehicle_brand(n=1)
+        self.assertEqual(len(brands), 1)
+        self.assertIn(brands[0], ALL_VEHICLE_BRAND_NAMES)
+
+    def test_uf_generator_with_a_single_uf(self):
+        ufs = uf(n=1)
+        self.assertEqual(len(ufs), 1)
+        self.assertIn(ufs[0], ALL_UF_CODE)
+
     def test_uf_generator_with_data_only_argument_as_true(self):
         ufs = uf(data_only=True)
         self.assertIsInstance(ufs, list)
@@ -66,6 +90,71 @@ class TestGenerators(unittest.TestCase):
         for uf_code in ufs:
             self.assertIsInstance(uf_code, str)
 
+    def test_async_vehicle_brand_generator(self):
+        brands = asyncio.run(avehicle_brand(n=3))
+        self.assertIsInstance(brands, list)
+        self.assertEqual(len(brands), 3)
+
+    def test_async_uf_generator(self):
+        ufs = asyncio.run(auf(n=3, data_only=False))
+        self.assertEqual(ufs['msg'], 'success')
+        self.assertEqual(len(ufs['data']), 3)
+
+    def test_people_bulk_generator_splits_total_in_chunks(self):
+        sizes = []
+
+        async def fake_request(content_length, referer, payload, as_bytes):
+            sizes.append(payload['txt_qtde'])
+            data = json.dumps([{'nome': 'Fulano'}] * payload['txt_qtde']).encode('utf-8')
+            return {'msg': 'success', 'data': data}
+
+        with mock.patch('fordev.generators.afordev_request', fake_request):
+            peoples = asyncio.run(apeople_bulk(total=45, chunk=20))
+
+        self.assertCountEqual(sizes, [20, 20, 5])
+        self.assertEqual(len(peoples), 45)
+
+    def test_if_people_bulk_generator_not_exceed_min_and_max_limit_of_chunk(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(apeople_bulk(total=10, chunk=31))
+        with self.assertRaises(ValueError):
+            asyncio.run(apeople_bulk(total=0))
+
+    def test_bundle_generator_returns_data_of_each_generator(self):
+        async def fake_request(content_length, referer, payload, **kwargs):
+            return {'msg': 'success', 'data': referer}
+
+        with mock.patch('fordev.generators.afordev_request', fake_request):
+            data = asyncio.run(bundle(cpf={'uf_code': 'SP'}, rg={}, uf={'n': 2}))
+
+        self.assertCountEqual(['cpf', 'rg', 'uf'], data.keys())
+        self.assertEqual(data['cpf'], 'gerador_de_cpf')
+        self.assertEqual(data['rg'], 'gerador_de_rg')
+        self.assertEqual(len(data['uf']), 2)
+
+    def test_if_bundle_generator_raises_for_invalid_generator(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(bundle(hue={}))
+
+    def test_if_bundle_generator_raises_for_invalid_arguments_before_creating_coroutines(self):
+        auf_mock = mock.Mock()
+
+        with mock.patch.dict('fordev.generators._ASYNC_GENERATORS', {'uf': auf_mock}):
+            with self.assertRaises(TypeError):
+                asyncio.run(bundle(uf={'n': 2}, cpf={'bogus': 1}))
+
+        auf_mock.assert_not_called()
+
+    def test_pre_encoded_payloads_match_the_urlencoded_payloads(self):
+        self.assertEqual(
+            _cpf_request(uf_code='sp', formatting=True)['payload'],
+            urlencode({'acao': 'gerar_cpf', 'pontuacao': 'S', 'cpf_estado': 'SP'}).encode('ascii')
+        )
+        self.assertEqual(
+            _certificate_request(type_='r', formatting=False)['payload'],
+            urlencode({'acao': 'gerador_certidao', 'pontuacao': 'N', 'tipo_certidao': 'casamento_religioso'}).encode('ascii')
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
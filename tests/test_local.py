@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Tests of fordev.local module."""
+
+import unittest
+
+from fordev.local import cpf_local
+from fordev.local import cnpj_local
+
+from fordev.consts import ALL_UF_CODE
+from fordev.consts import CPF_FISCAL_REGIONS
+
+
+def _cpf_check_digits(digits: list) -> tuple:
+    """Compute the CPF check digits using both full weight tables."""
+
+    dv1 = sum(d * w for d, w in zip(digits, range(10, 1, -1))) * 10 % 11 % 10
+    dv2 = sum(d * w for d, w in zip(digits + [dv1], range(11, 1, -1))) * 10 % 11 % 10
+
+    return dv1, dv2
+
+
+def _cnpj_check_digits(digits: list) -> tuple:
+    """Compute the CNPJ check digits using both full weight tables."""
+
+    s1 = sum(d * w for d, w in zip(digits, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    dv1 = 0 if s1 % 11 < 2 else 11 - s1 % 11
+
+    s2 = sum(d * w for d, w in zip(digits + [dv1], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    dv2 = 0 if s2 % 11 < 2 else 11 - s2 % 11
+
+    return dv1, dv2
+
+
+class TestLocal(unittest.TestCase):
+    """Test Class of fordev.local module."""
+
+    def test_cpf_local_check_digits(self):
+        for _ in range(1000):
+            digits = [int(c) for c in cpf_local(formatting=False)]
+            self.assertEqual(len(digits), 11)
+            self.assertEqual(_cpf_check_digits(digits[:9]), tuple(digits[9:]))
+
+    def test_cpf_local_formatting(self):
+        self.assertRegex(cpf_local(formatting=True), r'^\d{3}\.\d{3}\.\d{3}-\d{2}$')
+        self.assertRegex(cpf_local(formatting=False), r'^\d{11}$')
+
+    def test_cpf_local_fiscal_region_of_uf(self):
+        for uf_code in ALL_UF_CODE:
+            code = cpf_local(uf_code=uf_code.lower(), formatting=False)
+            self.assertEqual(int(code[8]), CPF_FISCAL_REGIONS[uf_code])
+
+    def test_cpf_local_with_invalid_uf(self):
+        with self.assertRaises(ValueError):
+            cpf_local(uf_code='HUE')
+
+    def test_cnpj_local_check_digits(self):
+        for _ in range(1000):
+            digits = [int(c) for c in cnpj_local(formatting=False)]
+            self.assertEqual(len(digits), 14)
+            self.assertEqual(digits[8:12], [0, 0, 0, 1])
+            self.assertEqual(_cnpj_check_digits(digits[:12]), tuple(digits[12:]))
+
+    def test_cnpj_local_formatting(self):
+        self.assertRegex(cnpj_local(formatting=True), r'^\d{2}\.\d{3}\.\d{3}/0001-\d{2}$')
+        self.assertRegex(cnpj_local(formatting=False), r'^\d{14}$')
+
+
+if __name__ == '__main__':
+    unittest.main()
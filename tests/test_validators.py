@@ -4,6 +4,9 @@
 import unittest
 
 from fordev.validators import raise_for_invalid_uf
+from fordev.validators import normalize_uf
+
+from fordev.consts import ALL_UF_CODE
 
 
 class TestValidators(unittest.TestCase):
@@ -16,6 +19,21 @@ class TestValidators(unittest.TestCase):
             raise_for_invalid_uf('HUE')
             raise_for_invalid_uf('', include_blank=False)
 
+    def test_raise_for_invalid_uf_with_all_uf_codes(self):
+        for uf_code in ALL_UF_CODE:
+            raise_for_invalid_uf(uf_code)
+            raise_for_invalid_uf(uf_code, include_blank=True)
+        with self.assertRaises(ValueError):
+            raise_for_invalid_uf('sp')
+
+    def test_normalize_uf(self):
+        self.assertEqual(normalize_uf('sp'), 'SP')
+        self.assertEqual(normalize_uf('', include_blank=True), '')
+        with self.assertRaises(ValueError):
+            normalize_uf('hue')
+        with self.assertRaises(ValueError):
+            normalize_uf('')
+
 
 if __name__ == '__main__':
     unittest.main()